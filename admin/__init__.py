@@ -2,6 +2,8 @@
 
 # Import main classes for easier access
 from .auth import PowerBIAuth
-from .client import PowerBIClient
+from .client import ListResult, PowerBIClient
+from .async_client import AsyncPowerBIClient
 from .gateway import GatewayAdmin
-from .workspace import WorkspaceAdmin 
\ No newline at end of file
+from .workspace import WorkspaceAdmin
+from .async_admin import AsyncGatewayAdmin, AsyncWorkspaceAdmin 
\ No newline at end of file
@@ -0,0 +1,232 @@
+import asyncio
+import aiohttp
+from cachetools import TTLCache
+from .async_client import AsyncPowerBIClient
+from .gateway import GatewayAdmin, _datasource_user_body
+from .workspace import _workspace_user_body
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Errors an async API call can end with: HTTP/connection failures, timeouts and undecodable bodies
+_API_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+class AsyncGatewayAdmin:
+    """Asynchronous counterpart of GatewayAdmin for fanning out gateway requests with asyncio."""
+
+    def __init__(self, client: AsyncPowerBIClient):
+        self.client = client
+        # Holds the lookup task per (gateway_id, datasource_id), including lookups still in flight
+        self._user_cache = TTLCache(maxsize=GatewayAdmin.CACHE_MAXSIZE, ttl=GatewayAdmin.CACHE_TTL)
+
+    def clear_cache(self):
+        """Drops all cached datasource users."""
+        self._user_cache.clear()
+
+    async def get_gateways(self) -> list[dict]:
+        """Retrieves a list of gateways the user has access to.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-gateways
+
+        Returns:
+            list[dict]: A list of gateway objects.
+        """
+        logger.info("Fetching gateways...")
+        gateways = [gateway async for gateway in self.client.get_all("gateways")]
+        logger.info("Found %s gateways.", len(gateways))
+        return gateways
+
+    async def get_gateway_datasources(self, gateway_id: str) -> list[dict]:
+        """Retrieves a list of datasources for a specific gateway.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-datasources
+
+        Args:
+            gateway_id: The ID of the gateway.
+
+        Returns:
+            list[dict]: A list of datasource objects for the gateway.
+        """
+        logger.info("Fetching datasources for gateway ID: %s", gateway_id)
+        endpoint = f"gateways/{gateway_id}/datasources"
+        datasources = [datasource async for datasource in self.client.get_all(endpoint)]
+        logger.info("Found %s datasources for gateway %s.", len(datasources), gateway_id)
+        return datasources
+
+    async def get_gateway_datasource_users(self, gateway_id: str, datasource_id: str) -> list[dict]:
+        """Retrieves a list of users who have access to a specific datasource.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-datasource-users
+
+        Lookups are cached per (gateway_id, datasource_id) for GatewayAdmin.CACHE_TTL
+        seconds. Concurrent lookups of the same pair share one in-flight request, and
+        failed lookups are not cached. Use clear_cache() to reset.
+
+        Args:
+            gateway_id: The ID of the gateway.
+            datasource_id: The ID of the datasource.
+
+        Returns:
+            list[dict]: A list of user objects with access to the datasource, or an empty list on error.
+        """
+        key = (gateway_id, datasource_id)
+        task = self._user_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_datasource_users(gateway_id, datasource_id))
+            self._user_cache[key] = task
+            task.add_done_callback(lambda done: self._drop_failed(key, done))
+        else:
+            logger.debug("Using cached users for datasource ID: %s on gateway ID: %s", datasource_id, gateway_id)
+        try:
+            # Shield the shared task so a cancelled caller does not cancel it for the others
+            return list(await asyncio.shield(task))
+        except _API_ERRORS as e:
+            # The client already logged the API response body
+            logger.error("Could not get users for datasource %s on gateway %s: %s", datasource_id, gateway_id, e)
+            return []
+
+    async def _fetch_datasource_users(self, gateway_id: str, datasource_id: str) -> list[dict]:
+        """Requests the users of a datasource from the API."""
+        logger.info("Fetching users for datasource ID: %s on gateway ID: %s", datasource_id, gateway_id)
+        endpoint = f"gateways/{gateway_id}/datasources/{datasource_id}/users"
+        response = await self.client.get(endpoint)
+        users = response.get("value", [])
+        logger.info("Found %s users for datasource %s.", len(users), datasource_id)
+        return users
+
+    def _drop_failed(self, key: tuple[str, str], task: asyncio.Future):
+        """Evicts a lookup task from the cache if it failed or was cancelled."""
+        if (task.cancelled() or task.exception() is not None) and self._user_cache.get(key) is task:
+            del self._user_cache[key]
+
+    async def add_datasource_user(
+        self,
+        gateway_id: str,
+        datasource_id: str,
+        principal_id: str,
+        principal_type: str, # 'User', 'Group', or 'ServicePrincipal'
+        access_right: str,   # 'Read' or 'ReadOverrideEffectiveIdentity'
+        display_name: str | None = None,
+        email_address: str | None = None,
+        profile: dict | None = None # For ServicePrincipal
+    ) -> bool:
+        """Adds a user or group to a gateway datasource with specified access rights.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/add-datasource-user
+
+        Args:
+            gateway_id: The ID of the gateway.
+            datasource_id: The ID of the datasource.
+            principal_id: The Object ID (GUID) of the principal (user, group, or service principal).
+            principal_type: The type of the principal ('User', 'Group', 'ServicePrincipal').
+            access_right: The access level ('Read' or 'ReadOverrideEffectiveIdentity').
+            display_name: Optional display name for the principal.
+            email_address: Optional email address (required for users).
+            profile: Optional service principal profile details.
+
+        Returns:
+            bool: True if the user was added successfully, False otherwise.
+        """
+        logger.info("Adding %s (ID: %s) to datasource %s on gateway %s with rights: %s", principal_type, principal_id, datasource_id, gateway_id, access_right)
+        endpoint = f"gateways/{gateway_id}/datasources/{datasource_id}/users"
+        body = _datasource_user_body(principal_id, principal_type, access_right, display_name, email_address, profile)
+        try:
+            await self.client.post(endpoint, data=body)
+            logger.info("Successfully added %s %s to datasource %s.", principal_type, principal_id, datasource_id)
+            self._user_cache.pop((gateway_id, datasource_id), None)
+            return True
+        except _API_ERRORS as e:
+            # The client already logged the API response body
+            logger.error("Failed to add user %s to datasource %s on gateway %s: %s", principal_id, datasource_id, gateway_id, e)
+            return False
+
+    async def add_datasource_users_bulk(self, entries: list[dict], concurrency: int = 8) -> list[bool]:
+        """Adds many users to gateway datasources concurrently.
+
+        Power BI throttles write operations, so the number of POSTs in flight is kept small.
+
+        Args:
+            entries: A list of keyword-argument dicts for add_datasource_user
+                     (gateway_id, datasource_id, principal_id, principal_type, access_right, ...).
+            concurrency: Maximum number of add requests in flight at once.
+
+        Returns:
+            list[bool]: For each entry, in order, True if the user was added successfully, False otherwise.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(entry: dict) -> bool:
+            async with semaphore:
+                return await self.add_datasource_user(**entry)
+
+        results = await asyncio.gather(*[add(entry) for entry in entries], return_exceptions=True)
+        for entry, result in zip(entries, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to add user %s to datasource %s: %s", entry.get('principal_id'), entry.get('datasource_id'), result)
+        return [result is True for result in results]
+
+
+class AsyncWorkspaceAdmin:
+    """Asynchronous counterpart of WorkspaceAdmin for fanning out workspace requests with asyncio."""
+
+    def __init__(self, client: AsyncPowerBIClient):
+        self.client = client
+
+    async def add_workspace_user(
+        self,
+        workspace_id: str,
+        identifier: str,
+        principal_type: str, # 'User', 'Group', 'ServicePrincipal', 'App'
+        access_right: str,   # 'Admin', 'Member', 'Contributor', 'Viewer'
+        email_address: str | None = None # Required for 'User' principal type
+    ) -> bool:
+        """Adds a user or principal to a workspace with specified access rights.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/groups/add-group-user
+
+        Args:
+            workspace_id: The ID of the workspace (group).
+            identifier: The identifier of the principal (email/UPN for 'User', object or application ID otherwise).
+            principal_type: Type of principal ('User', 'Group', 'ServicePrincipal', 'App').
+            access_right: Access level ('Admin', 'Member', 'Contributor', 'Viewer').
+            email_address: Required when principal_type is 'User'.
+
+        Returns:
+            bool: True if the user was added successfully, False otherwise.
+        """
+        logger.info("Adding %s (%s) to workspace %s with rights: %s", principal_type, identifier, workspace_id, access_right)
+        endpoint = f"groups/{workspace_id}/users"
+        body = _workspace_user_body(identifier, principal_type, access_right, email_address)
+        try:
+            await self.client.post(endpoint, data=body)
+            logger.info("Successfully added %s %s to workspace %s.", principal_type, identifier, workspace_id)
+            return True
+        except _API_ERRORS as e:
+            # The client already logged the API response body
+            logger.error("Failed to add %s %s to workspace %s: %s", principal_type, identifier, workspace_id, e)
+            return False
+
+    async def add_workspace_users_bulk(self, entries: list[dict], concurrency: int = 8) -> list[bool]:
+        """Adds many users to workspaces concurrently.
+
+        Power BI throttles write operations, so the number of POSTs in flight is kept small.
+
+        Args:
+            entries: A list of keyword-argument dicts for add_workspace_user
+                     (workspace_id, identifier, principal_type, access_right, ...).
+            concurrency: Maximum number of add requests in flight at once.
+
+        Returns:
+            list[bool]: For each entry, in order, True if the user was added successfully, False otherwise.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(entry: dict) -> bool:
+            async with semaphore:
+                return await self.add_workspace_user(**entry)
+
+        results = await asyncio.gather(*[add(entry) for entry in entries], return_exceptions=True)
+        for entry, result in zip(entries, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to add %s to workspace %s: %s", entry.get('identifier'), entry.get('workspace_id'), result)
+        return [result is True for result in results]
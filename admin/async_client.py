@@ -0,0 +1,172 @@
+import asyncio
+import aiohttp
+import orjson
+import logging
+from collections.abc import AsyncIterator
+from .auth import PowerBIAuth, parse_claims_challenge
+from .client import ListResult, PowerBIClient
+
+logger = logging.getLogger(__name__)
+
+class AsyncPowerBIClient:
+    """Asynchronous client for interacting with the Power BI REST API using aiohttp."""
+
+    BASE_URL = PowerBIClient.BASE_URL
+
+    def __init__(self, auth: PowerBIAuth, concurrency: int = 32):
+        """Initializes the async client.
+
+        Args:
+            auth: The authentication handler used to obtain access tokens.
+            concurrency: Maximum number of requests in flight at once, to respect Power BI throttling.
+        """
+        self.auth = auth
+        self._base = self.BASE_URL.rstrip('/') + '/'
+        self.session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # Token currently set in the session's Authorization header
+        self._applied_token: str | None = None
+        # Serializes token acquisition, which runs in a worker thread
+        self._auth_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncPowerBIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _get_session(self, stale_token: str | None = None, claims: str | None = None) -> aiohttp.ClientSession:
+        """Returns the shared aiohttp session, creating it on first use and refreshing the token if needed."""
+        access_token = self.auth.cached_token()
+        if access_token is None or access_token == stale_token:
+            # Token acquisition may run a CLI subprocess or an IMDS call, so keep it off the event loop
+            async with self._auth_lock:
+                access_token = await asyncio.to_thread(self.auth.ensure_fresh, force_if=stale_token, claims=claims)
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Content-Type": "application/json"},
+            )
+        if access_token != self._applied_token:
+            self.session.headers["Authorization"] = f"Bearer {access_token}"
+            self._applied_token = access_token
+        return self.session
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Makes a request to the Power BI API and returns the decoded JSON body.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: API endpoint path (relative to BASE_URL).
+            **kwargs: Additional arguments passed to aiohttp.ClientSession.request.
+
+        Returns:
+            dict: The JSON response from the API, or an empty dict if there is no body.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+        """
+        url = self._base + endpoint.lstrip('/')
+        return await self._request_url(method, url, **kwargs)
+
+    async def _request_url(self, method: str, url: str, **kwargs) -> dict:
+        """Makes a request to an absolute Power BI API URL (e.g., a pagination continuation link).
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full request URL.
+            **kwargs: Additional arguments passed to aiohttp.ClientSession.request.
+
+        Returns:
+            dict: The JSON response from the API, or an empty dict if there is no body.
+
+        Raises:
+            aiohttp.ClientError: If the request fails.
+        """
+        session = await self._get_session()
+
+        logger.debug("Making async %s request to %s", method, url)
+        async with self._semaphore:
+            response = await session.request(method, url, **kwargs)
+            if response.status == 401:
+                # The token was rejected; ask for another one and retry once
+                stale_token = response.request_info.headers.get("Authorization", "").removeprefix("Bearer ")
+                claims = parse_claims_challenge(response.headers.get("WWW-Authenticate"))
+                session = await self._get_session(stale_token=stale_token, claims=claims)
+                if self._applied_token != stale_token:
+                    logger.info("Received 401 for %s, retrying once with a new access token.", url)
+                    response.release()
+                    response = await session.request(method, url, **kwargs)
+                else:
+                    # azure-identity served the same token from its cache; resending it would only 401 again
+                    logger.warning("Received 401 for %s and the credential returned the same token; not retrying.", url)
+            async with response:
+                if response.status >= 400:
+                    logger.error("HTTP error occurred: %s %s for url: %s - %s", response.status, response.reason, url, await response.text())
+                    response.raise_for_status()
+                logger.debug("Request successful: %s", response.status)
+                body = await response.read()
+        # Handle responses without a body (e.g., 204 No Content)
+        if not body:
+            return {}
+        return orjson.loads(body)
+
+    async def get(self, endpoint: str, params: dict | None = None) -> ListResult:
+        """Sends a GET request to the API.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+
+        Returns:
+            ListResult: The decoded JSON response, including any continuation link.
+        """
+        return await self._request("GET", endpoint, params=params)
+
+    async def get_all(self, endpoint: str, params: dict | None = None) -> AsyncIterator[dict]:
+        """Sends a GET request and yields the items of every page of the response.
+
+        Follows 'continuationUri' (admin endpoints) and '@odata.nextLink' links until
+        the last page, like PowerBIClient.get_all.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters for the first page.
+
+        Yields:
+            dict: Each item from the 'value' array of every page.
+        """
+        page = await self.get(endpoint, params=params)
+        for item in page.get("value", []):
+            yield item
+        next_url = PowerBIClient.next_link(page)
+        while next_url:
+            logger.debug("Following continuation link for %s", endpoint)
+            page = await self._request_url("GET", next_url)
+            for item in page.get("value", []):
+                yield item
+            next_url = PowerBIClient.next_link(page)
+
+    async def post(self, endpoint: str, json: dict | None = None, data: bytes | None = None) -> dict:
+        """Sends a POST request to the API.
+
+        Args:
+            endpoint: API endpoint path.
+            json: Optional JSON payload.
+            data: Optional pre-serialized JSON payload, used instead of json.
+
+        Returns:
+            dict: The JSON response from the API, or an empty dict if there is no body.
+        """
+        # Serialize with orjson; the session already sends 'Content-Type: application/json'
+        if data is None and json is not None:
+            data = orjson.dumps(json)
+        return await self._request("POST", endpoint, data=data)
+
+    async def close(self):
+        """Closes the underlying aiohttp session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._applied_token = None
@@ -1,24 +1,82 @@
+import base64
 import logging
-from azure.identity import DefaultAzureCredential, CredentialUnavailableError
+import re
+import threading
+import time
+from azure.core.credentials import AccessToken
+from azure.core.exceptions import ClientAuthenticationError
+from azure.identity import (
+    AzureCliCredential,
+    ChainedTokenCredential,
+    EnvironmentCredential,
+    ManagedIdentityCredential,
+)
 
 logger = logging.getLogger(__name__)
 
+_CLAIMS_PATTERN = re.compile(r'claims="([^"]+)"')
+
+def parse_claims_challenge(www_authenticate: str | None) -> str | None:
+    """Extracts the decoded claims from a 401 response's WWW-Authenticate header, if present.
+
+    Args:
+        www_authenticate: The WWW-Authenticate header value.
+
+    Returns:
+        str | None: The claims JSON string, or None if the header carries no claims challenge.
+    """
+    match = _CLAIMS_PATTERN.search(www_authenticate or "")
+    if not match:
+        return None
+    encoded = match.group(1)
+    try:
+        return base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+    except ValueError:
+        logger.warning("Ignoring malformed claims challenge: %s", encoded)
+        return None
+
 class PowerBIAuth:
-    """Handles authentication using DefaultAzureCredential to obtain tokens for Power BI API access."""
+    """Handles authentication using a chain of Azure Identity credentials to obtain tokens for Power BI API access."""
+
+    # Refresh the cached token when it is this close (in seconds) to expiring.
+    TOKEN_REFRESH_MARGIN = 60
 
-    def __init__(self, tenant_id: str | None = None):
+    # Credential kinds that can be combined into the credential chain.
+    CREDENTIAL_KINDS = {
+        "env": EnvironmentCredential,
+        "managed_identity": ManagedIdentityCredential,
+        "cli": AzureCliCredential,
+    }
+    DEFAULT_CREDENTIAL_KINDS = ["env", "managed_identity", "cli"]
+
+    def __init__(self, tenant_id: str | None = None, credential_kinds: list[str] | None = None):
         """Initializes the authentication handler.
 
         Args:
-            tenant_id: Optional Tenant ID. If provided, credentials will be restricted
-                       to this tenant. If None, DefaultAzureCredential will try to
-                       determine the tenant from the environment or logged-in user.
+            tenant_id: Optional Tenant ID. If provided, Azure CLI credentials will be
+                       restricted to this tenant. If None, the tenant is determined from
+                       the environment or logged-in user.
+            credential_kinds: Optional ordered list of credentials to try, from 'env',
+                              'managed_identity' and 'cli'. Narrowing this to the one
+                              credential a deployment actually uses avoids probing the
+                              others on every token acquisition. Defaults to all three.
+
+        Raises:
+            ValueError: If credential_kinds is empty or contains an unknown kind.
         """
         self.tenant_id = tenant_id
         self.scope = ["https://analysis.windows.net/powerbi/api/.default"]
-        # Initialize DefaultAzureCredential, optionally specifying the tenant ID
+        self._token: AccessToken | None = None
+        self._token_lock = threading.Lock()
+        self.credential_kinds = self.DEFAULT_CREDENTIAL_KINDS if credential_kinds is None else credential_kinds
+        if not self.credential_kinds:
+            raise ValueError(f"credential_kinds must not be empty. Expected any of {list(self.CREDENTIAL_KINDS)}.")
+        unknown = [kind for kind in self.credential_kinds if kind not in self.CREDENTIAL_KINDS]
+        if unknown:
+            raise ValueError(f"Unknown credential kinds: {unknown}. Expected any of {list(self.CREDENTIAL_KINDS)}.")
+        # Initialize the credential chain, optionally specifying the tenant ID
         try:
-            self.credential = DefaultAzureCredential(authority=f"https://login.microsoftonline.com/{self.tenant_id}" if self.tenant_id else None)
+            self.credential = ChainedTokenCredential(*[self._create_credential(kind) for kind in self.credential_kinds])
             # Perform a quick check to see if credentials might be available
             # This is not foolproof but can catch immediate configuration issues.
             # self.credential.get_token(self.scope)
@@ -26,30 +84,72 @@ class PowerBIAuth:
              logger.error("Azure Identity library not installed. Please install 'azure-identity'.")
              raise
         except Exception as e:
-            logger.error(f"Error initializing DefaultAzureCredential: {e}")
+            logger.error(f"Error initializing credential chain {self.credential_kinds}: {e}")
             raise
 
+    def _create_credential(self, kind: str):
+        """Creates a single credential of the given kind."""
+        if kind == "cli" and self.tenant_id:
+            return AzureCliCredential(tenant_id=self.tenant_id)
+        return self.CREDENTIAL_KINDS[kind]()
+
     def get_access_token(self) -> str:
-        """Acquires an access token for the Power BI API using DefaultAzureCredential.
+        """Acquires an access token for the Power BI API using the credential chain.
 
-        DefaultAzureCredential attempts various strategies (Environment, Managed Identity,
-        Azure CLI, etc.) to obtain a token.
+        The chain tries each configured credential (Environment, Managed Identity,
+        Azure CLI) in order to obtain a token. The token is cached and reused until it is
+        within TOKEN_REFRESH_MARGIN seconds of expiring.
 
         Returns:
             str: The access token.
 
         Raises:
-            CredentialUnavailableError: If DefaultAzureCredential fails to find credentials
-                                       or authenticate.
+            ClientAuthenticationError: If no credential in the chain can authenticate.
             Exception: For other potential errors during token acquisition.
         """
+        return self.ensure_fresh()
+
+    def ensure_fresh(self, force_if: str | None = None, claims: str | None = None) -> str:
+        """Returns a valid access token, acquiring a new one only if the cached token is near expiry.
+
+        Args:
+            force_if: A token the API rejected (e.g., with 401). If it is still the cached
+                      token, the credential chain is asked again; if another caller already
+                      replaced it, the cached token is returned without a new acquisition.
+                      Note that azure-identity serves unexpired tokens from its own cache, so
+                      without claims the chain may hand back the same rejected token.
+            claims: Optional claims challenge from the 401 response. Passing it makes
+                    azure-identity bypass its token cache and request a new token.
+
+        Returns:
+            str: The access token.
+        """
+        with self._token_lock:
+            stale = force_if is not None and self._token is not None and self._token.token == force_if
+            if not stale and self._token and self._token.expires_on - time.time() > self.TOKEN_REFRESH_MARGIN:
+                return self._token.token
+            self._token = self._acquire_token(claims if stale else None)
+            return self._token.token
+
+    def cached_token(self) -> str | None:
+        """Returns the cached access token if it is not near expiry, without acquiring a new one."""
+        token = self._token
+        if token and token.expires_on - time.time() > self.TOKEN_REFRESH_MARGIN:
+            return token.token
+        return None
+
+    def _acquire_token(self, claims: str | None = None) -> AccessToken:
+        """Requests a token from the credential chain, passing any claims challenge through."""
         try:
-            logger.info("Attempting to acquire token using DefaultAzureCredential...")
-            access_token_info = self.credential.get_token(*self.scope)
+            logger.info("Attempting to acquire token using credential chain %s...", self.credential_kinds)
+            if claims:
+                access_token_info = self.credential.get_token(self.scope[0], claims=claims)
+            else:
+                access_token_info = self.credential.get_token(self.scope[0])
             logger.info("Successfully acquired access token.")
-            return access_token_info.token
-        except CredentialUnavailableError as e:
-            logger.error(f"DefaultAzureCredential failed: {e}")
+            return access_token_info
+        except ClientAuthenticationError as e:
+            logger.error(f"Credential chain failed: {e}")
             logger.error("Ensure you are logged in via Azure CLI ('az login'), "
                          "or have environment variables (AZURE_CLIENT_ID, AZURE_CLIENT_SECRET, AZURE_TENANT_ID), "
                          "or are running in an environment with Managed Identity.")
@@ -1,25 +1,71 @@
+import ijson
+import orjson
 import requests
 import logging
-from .auth import PowerBIAuth
+from collections.abc import Generator, Iterator
+from typing import TypedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .auth import PowerBIAuth, parse_claims_challenge
 
 logger = logging.getLogger(__name__)
 
+# Shape of a decoded list response. 'continuationUri' (admin endpoints) and
+# '@odata.nextLink' are only present when another page is available.
+ListResult = TypedDict(
+    "ListResult",
+    {"value": list[dict], "continuationUri": str, "@odata.nextLink": str},
+    total=False,
+)
+
 class PowerBIClient:
     """Base client for interacting with the Power BI REST API."""
 
     BASE_URL = "https://api.powerbi.com/v1.0/myorg"
 
+    # Connection pool sizing for the mounted HTTPAdapter (requests defaults to 10/10).
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+
     def __init__(self, auth: PowerBIAuth):
         self.auth = auth
+        self._base = self.BASE_URL.rstrip('/') + '/'
         self.session = requests.Session()
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST", "DELETE", "PUT", "PATCH"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Let raise_for_status() report the final response
+        )
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Token currently set in the session's Authorization header
+        self._applied_token: str | None = None
+
+    def __enter__(self) -> "PowerBIClient":
+        return self
 
-    def _get_headers(self) -> dict:
-        """Returns the headers required for API requests."""
-        access_token = self.auth.get_access_token()
-        return {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the underlying session and its pooled connections."""
+        self.session.close()
+
+    def _ensure_auth(self, stale_token: str | None = None, claims: str | None = None) -> str:
+        """Sets the Authorization header on the session, updating it only when the token rotates.
+
+        The applied token is tracked per client, since the auth object may be shared by
+        several clients and rotated by any of them.
+        """
+        access_token = self.auth.ensure_fresh(force_if=stale_token, claims=claims)
+        if access_token != self._applied_token:
+            self.session.headers["Authorization"] = f"Bearer {access_token}"
+            self._applied_token = access_token
+        return access_token
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Makes a request to the Power BI API.
@@ -35,23 +81,80 @@ class PowerBIClient:
         Raises:
             requests.exceptions.RequestException: If the request fails.
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        url = self._base + endpoint.lstrip('/')
+        return self._request_url(method, url, **kwargs)
+
+    def _request_url(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Makes a request to an absolute Power BI API URL (e.g., a pagination continuation link).
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full request URL.
+            **kwargs: Additional arguments passed to requests.request.
+
+        Returns:
+            requests.Response: The API response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        self._ensure_auth()
 
-        logger.debug(f"Making {method} request to {url}")
+        logger.debug("Making %s request to %s", method, url)
         try:
-            response = self.session.request(method, url, headers=headers, **kwargs)
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code == 401:
+                # The token was rejected; ask for another one and retry once rather than
+                # going through the Retry policy's backoff on a deterministic failure.
+                # Only the token this request was sent with is replaced, so concurrent
+                # 401s trigger a single acquisition.
+                stale_token = response.request.headers.get("Authorization", "").removeprefix("Bearer ")
+                claims = parse_claims_challenge(response.headers.get("WWW-Authenticate"))
+                access_token = self._ensure_auth(stale_token=stale_token, claims=claims)
+                if access_token != stale_token:
+                    logger.info("Received 401 for %s, retrying once with a new access token.", url)
+                    response.close()
+                    response = self.session.request(method, url, **kwargs)
+                else:
+                    # azure-identity served the same token from its cache; resending it would only 401 again
+                    logger.warning("Received 401 for %s and the credential returned the same token; not retrying.", url)
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            logger.debug(f"Request successful: {response.status_code}")
+            logger.debug("Request successful: %s", response.status_code)
             return response
         except requests.exceptions.HTTPError as http_err:
-            logger.error(f"HTTP error occurred: {http_err} - {response.text}")
+            # Decode the error body once so handlers can log it without re-parsing
+            try:
+                http_err.powerbi_body = self._json(response)
+            except ValueError:
+                http_err.powerbi_body = response.text
+            logger.error("HTTP error occurred: %s - %s", http_err, response.text)
             raise
         except requests.exceptions.RequestException as req_err:
-            logger.error(f"Request exception occurred: {req_err}")
+            logger.error("Request exception occurred: %s", req_err)
             raise
 
-    def get(self, endpoint: str, params: dict | None = None) -> dict:
+    @staticmethod
+    def _json(response: requests.Response) -> dict:
+        """Decodes a JSON response body with orjson, returning an empty dict if there is no body.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON, like response.json().
+        """
+        if not response.content:
+            return {}
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    @staticmethod
+    def log_api_error(error: requests.exceptions.RequestException):
+        """Logs the status code and decoded body of a failed API response, if there is one."""
+        if isinstance(error, requests.exceptions.HTTPError):
+            logger.error("API Response Status: %s", error.response.status_code)
+            logger.error("API Response Body: %s", getattr(error, 'powerbi_body', error.response.text))
+
+    def get(self, endpoint: str, params: dict | None = None) -> ListResult:
         """Sends a GET request to the API.
 
         Args:
@@ -59,29 +162,98 @@ class PowerBIClient:
             params: Optional query parameters.
 
         Returns:
-            dict: The JSON response from the API.
+            ListResult: The decoded JSON response, including any continuation link.
         """
         response = self._request("GET", endpoint, params=params)
-        return response.json()
+        return self._json(response)
+
+    def get_all(self, endpoint: str, params: dict | None = None) -> Iterator[dict]:
+        """Sends a GET request and yields the items of every page of the response.
+
+        Follows 'continuationUri' (admin endpoints) and '@odata.nextLink' links until
+        the last page, reusing the session's pooled connection for each page.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters for the first page.
+
+        Yields:
+            dict: Each item from the 'value' array of every page.
+        """
+        page = self.get(endpoint, params=params)
+        yield from page.get("value", [])
+        next_url = self.next_link(page)
+        while next_url:
+            logger.debug("Following continuation link for %s", endpoint)
+            page = self._json(self._request_url("GET", next_url))
+            yield from page.get("value", [])
+            next_url = self.next_link(page)
+
+    @staticmethod
+    def next_link(page: ListResult) -> str | None:
+        """Returns the link to the next page of a list response, or None on the last page."""
+        return page.get("continuationUri") or page.get("@odata.nextLink")
+
+    def iter_values(self, endpoint: str, params: dict | None = None) -> Iterator[dict]:
+        """Streams a GET response and yields items of its 'value' array as they are parsed.
+
+        Unlike get_all, pages are never fully buffered in memory, which keeps peak memory
+        low for large list endpoints. Continuation links are followed like in get_all.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters for the first page.
+
+        Yields:
+            dict: Each item from the 'value' array of every page.
+        """
+        url = self._base + endpoint.lstrip('/')
+        while url:
+            with self._request_url("GET", url, params=params, stream=True) as response:
+                response.raw.decode_content = True  # Let urllib3 undo any gzip encoding
+                url = yield from self._iter_page(response.raw)
+            params = None  # Continuation links already carry the query
+
+    @staticmethod
+    def _iter_page(stream) -> Generator[dict, None, str | None]:
+        """Incrementally parses one page, yielding 'value' items and returning the continuation link."""
+        next_url = None
+        builder = None
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "value.item" and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix == "value.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix in ("continuationUri", "@odata.nextLink") and event == "string":
+                next_url = value
+        return next_url
 
-    def post(self, endpoint: str, json: dict | None = None) -> dict:
+    def post(self, endpoint: str, json: dict | None = None, data: bytes | None = None) -> dict:
         """Sends a POST request to the API.
 
         Args:
             endpoint: API endpoint path.
             json: Optional JSON payload.
+            data: Optional pre-serialized JSON payload, used instead of json.
 
         Returns:
             dict: The JSON response from the API.
         """
-        response = self._request("POST", endpoint, json=json)
+        # Serialize with orjson; the session already sends 'Content-Type: application/json'
+        if data is None and json is not None:
+            data = orjson.dumps(json)
+        response = self._request("POST", endpoint, data=data)
         # Handle cases where POST might not return JSON (e.g., 204 No Content)
         if response.status_code == 204:
             return {}
         try:
-            return response.json()
+            return self._json(response)
         except requests.exceptions.JSONDecodeError:
-             logger.warning(f"POST request to {endpoint} did not return JSON. Status: {response.status_code}")
+             logger.warning("POST request to %s did not return JSON. Status: %s", endpoint, response.status_code)
              return {}
 
     # Add methods for PUT, DELETE, PATCH as needed
@@ -98,10 +270,10 @@ class PowerBIClient:
         response = self._request("DELETE", endpoint, params=params)
         # Handle cases where DELETE might not return JSON (e.g., 204 No Content or 200 OK with no body)
         if response.status_code in [200, 204] and not response.content:
-             logger.debug(f"DELETE request to {endpoint} successful with status {response.status_code} and no content.")
+             logger.debug("DELETE request to %s successful with status %s and no content.", endpoint, response.status_code)
              return {}
         try:
-            return response.json()
+            return self._json(response)
         except requests.exceptions.JSONDecodeError:
-             logger.warning(f"DELETE request to {endpoint} did not return JSON. Status: {response.status_code}")
+             logger.warning("DELETE request to %s did not return JSON. Status: %s", endpoint, response.status_code)
              return {} 
\ No newline at end of file
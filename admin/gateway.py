@@ -1,13 +1,75 @@
+import functools
+import orjson
+import requests
+import threading
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from .client import PowerBIClient
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True, frozen=True)
+class DatasourceUserAdd:
+    """Request body fields for the Add Datasource User API."""
+
+    principal_id: str
+    principal_type: str
+    access_right: str
+    display_name: str | None = None
+    email_address: str | None = None
+
+@functools.lru_cache(maxsize=4096)
+def _serialize(record: DatasourceUserAdd) -> bytes:
+    """Serializes a DatasourceUserAdd record to the JSON request body, caching repeated records."""
+    return orjson.dumps(_payload(record))
+
+def _payload(record: DatasourceUserAdd) -> dict:
+    """Builds the request body dict for a DatasourceUserAdd record, omitting unset fields."""
+    payload = {
+        "identifier": record.principal_id,
+        "principalType": record.principal_type,
+        "datasourceUserAccessRight": record.access_right,
+    }
+    if record.display_name:
+        payload["displayName"] = record.display_name
+    if record.email_address:
+        payload["emailAddress"] = record.email_address
+    return payload
+
+def _datasource_user_body(
+    principal_id: str,
+    principal_type: str,
+    access_right: str,
+    display_name: str | None = None,
+    email_address: str | None = None,
+    profile: dict | None = None
+) -> bytes:
+    """Builds the serialized request body for the Add Datasource User API."""
+    record = DatasourceUserAdd(principal_id, principal_type, access_right, display_name, email_address)
+    if principal_type == 'ServicePrincipal' and profile:
+        # Profiles are unhashable dicts, so these bodies bypass the serialization cache
+        return orjson.dumps({**_payload(record), "profile": profile})
+    if principal_type == 'User' and not email_address:
+         logger.warning("Adding a user principal (%s) without an emailAddress is often problematic.", principal_id)
+         # Consider raising an error or requiring email for User type
+    return _serialize(record)
+
 class GatewayAdmin:
     """Provides methods for administering Power BI On-premises Data Gateways."""
 
+    # Datasource lists and datasource users are cached for this many seconds.
+    CACHE_TTL = 300
+    CACHE_MAXSIZE = 4096
+
     def __init__(self, client: PowerBIClient):
         self.client = client
+        self._ds_cache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._user_cache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._cache_lock = threading.Lock()  # TTLCache is not thread-safe
 
     def get_gateways(self) -> list[dict]:
         """Retrieves a list of gateways the user has access to.
@@ -18,34 +80,75 @@ class GatewayAdmin:
             list[dict]: A list of gateway objects.
         """
         logger.info("Fetching gateways...")
-        response = self.client.get("gateways")
-        gateways = response.get("value", [])
-        logger.info(f"Found {len(gateways)} gateways.")
+        gateways = list(self.client.get_all("gateways"))
+        logger.info("Found %s gateways.", len(gateways))
         return gateways
 
+    def iter_gateways(self) -> Iterator[dict]:
+        """Streams the gateways the user has access to without loading the full list into memory.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-gateways
+
+        Yields:
+            dict: Each gateway object.
+        """
+        logger.info("Streaming gateways...")
+        yield from self.client.iter_values("gateways")
+
     def get_gateway_datasources(self, gateway_id: str) -> list[dict]:
         """Retrieves a list of datasources for a specific gateway.
 
         Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-datasources
 
+        Results are cached per gateway for CACHE_TTL seconds; use
+        invalidate() to drop a cached entry after changing a gateway. Each call returns
+        a new list, but the datasource dicts are shared with the cache and should be
+        treated as read-only.
+
         Args:
             gateway_id: The ID of the gateway.
 
         Returns:
             list[dict]: A list of datasource objects for the gateway.
         """
-        logger.info(f"Fetching datasources for gateway ID: {gateway_id}")
+        key = hashkey(gateway_id)
+        with self._cache_lock:
+            cached = self._ds_cache.get(key)
+        if cached is not None:
+            logger.debug("Using cached datasources for gateway ID: %s", gateway_id)
+            return list(cached)
+        logger.info("Fetching datasources for gateway ID: %s", gateway_id)
         endpoint = f"gateways/{gateway_id}/datasources"
-        response = self.client.get(endpoint)
-        datasources = response.get("value", [])
-        logger.info(f"Found {len(datasources)} datasources for gateway {gateway_id}.")
-        return datasources
+        datasources = list(self.client.get_all(endpoint))
+        logger.info("Found %s datasources for gateway %s.", len(datasources), gateway_id)
+        with self._cache_lock:
+            self._ds_cache[key] = datasources
+        return list(datasources)
+
+    def invalidate(self, gateway_id: str):
+        """Drops the cached datasource list for a gateway, if any.
+
+        Args:
+            gateway_id: The ID of the gateway.
+        """
+        with self._cache_lock:
+            self._ds_cache.pop(hashkey(gateway_id), None)
+
+    def clear_cache(self):
+        """Drops all cached datasource lists and datasource users."""
+        with self._cache_lock:
+            self._ds_cache.clear()
+            self._user_cache.clear()
 
     def get_gateway_datasource_users(self, gateway_id: str, datasource_id: str) -> list[dict]:
         """Retrieves a list of users who have access to a specific datasource.
 
         Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/gateways/get-datasource-users
 
+        Successful results are cached per (gateway_id, datasource_id) for CACHE_TTL
+        seconds, so repeated lookups skip the HTTP call; use clear_cache() to reset.
+        As with get_gateway_datasources, the user dicts are shared with the cache.
+
         Args:
             gateway_id: The ID of the gateway.
             datasource_id: The ID of the datasource.
@@ -53,26 +156,49 @@ class GatewayAdmin:
         Returns:
             list[dict]: A list of user objects with access to the datasource.
         """
-        logger.info(f"Fetching users for datasource ID: {datasource_id} on gateway ID: {gateway_id}")
+        key = (gateway_id, datasource_id)
+        with self._cache_lock:
+            cached = self._user_cache.get(key)
+        if cached is not None:
+            logger.debug("Using cached users for datasource ID: %s on gateway ID: %s", datasource_id, gateway_id)
+            return list(cached)
+        logger.info("Fetching users for datasource ID: %s on gateway ID: %s", datasource_id, gateway_id)
         endpoint = f"gateways/{gateway_id}/datasources/{datasource_id}/users"
         # This API might require specific permissions (Datasource.Read.All or Datasource.ReadWrite.All)
         try:
             response = self.client.get(endpoint)
             users = response.get("value", [])
-            logger.info(f"Found {len(users)} users for datasource {datasource_id}.")
-            return users
-        except Exception as e:
+            logger.info("Found %s users for datasource %s.", len(users), datasource_id)
+            with self._cache_lock:
+                self._user_cache[key] = users
+            return list(users)
+        except requests.exceptions.RequestException as e:
             # Handle potential permission errors or other issues gracefully
-            logger.error(f"Could not get users for datasource {datasource_id} on gateway {gateway_id}: {e}")
-            # Check if the error response is available and contains details
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"API Response Status: {e.response.status_code}")
-                try:
-                    logger.error(f"API Response Body: {e.response.json()}")
-                except Exception:
-                    logger.error(f"API Response Body: {e.response.text}")
+            logger.error("Could not get users for datasource %s on gateway %s: %s", datasource_id, gateway_id, e)
+            self.client.log_api_error(e)
             return [] # Return empty list on error
 
+    def get_datasource_users_bulk(self, pairs: list[tuple[str, str]], max_workers: int = 16) -> dict[tuple[str, str], list[dict]]:
+        """Retrieves users for many datasources concurrently using a thread pool.
+
+        The threads share the client's pooled session, so connections are reused across calls.
+        Failed lookups yield an empty list, as in get_gateway_datasource_users.
+
+        Args:
+            pairs: A list of (gateway_id, datasource_id) tuples.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            dict[tuple[str, str], list[dict]]: A mapping of (gateway_id, datasource_id) to the datasource users.
+        """
+        logger.info("Fetching users for %s datasources with up to %s workers...", len(pairs), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_gateway_datasource_users, gateway_id, datasource_id): (gateway_id, datasource_id)
+                for gateway_id, datasource_id in dict.fromkeys(pairs)  # Skip duplicate pairs
+            }
+            return {futures[future]: future.result() for future in as_completed(futures)}
+
     def add_datasource_user(
         self,
         gateway_id: str,
@@ -101,37 +227,20 @@ class GatewayAdmin:
         Returns:
             bool: True if the user was added successfully, False otherwise.
         """
-        logger.info(f"Adding {principal_type} (ID: {principal_id}) to datasource {datasource_id} on gateway {gateway_id} with rights: {access_right}")
+        logger.info("Adding %s (ID: %s) to datasource %s on gateway %s with rights: %s", principal_type, principal_id, datasource_id, gateway_id, access_right)
         endpoint = f"gateways/{gateway_id}/datasources/{datasource_id}/users"
 
-        payload = {
-            "identifier": principal_id,
-            "principalType": principal_type,
-            "datasourceUserAccessRight": access_right,
-        }
-        if display_name:
-            payload["displayName"] = display_name
-        if email_address:
-            payload["emailAddress"] = email_address
-        if principal_type == 'ServicePrincipal' and profile:
-            payload["profile"] = profile
-        elif principal_type == 'User' and not email_address:
-             logger.warning(f"Adding a user principal ({principal_id}) without an emailAddress is often problematic.")
-             # Consider raising an error or requiring email for User type
+        body = _datasource_user_body(principal_id, principal_type, access_right, display_name, email_address, profile)
 
         try:
             # This POST request typically returns 200 OK on success with no body, or 201 Created.
             # The base client handles JSON decoding and status code checks.
-            self.client.post(endpoint, json=payload)
-            logger.info(f"Successfully added {principal_type} {principal_id} to datasource {datasource_id}.")
+            self.client.post(endpoint, data=body)
+            logger.info("Successfully added %s %s to datasource %s.", principal_type, principal_id, datasource_id)
+            with self._cache_lock:
+                self._user_cache.pop((gateway_id, datasource_id), None)
             return True
-        except Exception as e:
-            logger.error(f"Failed to add user {principal_id} to datasource {datasource_id} on gateway {gateway_id}: {e}")
-            # Log specific API error details if available
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"API Response Status: {e.response.status_code}")
-                try:
-                    logger.error(f"API Response Body: {e.response.json()}")
-                except Exception:
-                    logger.error(f"API Response Body: {e.response.text}")
-            return False 
\ No newline at end of file
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to add user %s to datasource %s on gateway %s: %s", principal_id, datasource_id, gateway_id, e)
+            self.client.log_api_error(e)
+            return False 
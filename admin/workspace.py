@@ -1,8 +1,52 @@
+import functools
+import orjson
+import requests
+from collections.abc import Iterator
+from dataclasses import dataclass
+from urllib.parse import quote
 from .client import PowerBIClient
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True, frozen=True)
+class WorkspaceUserAdd:
+    """Request body fields for the Add Group User API."""
+
+    identifier: str
+    principal_type: str
+    access_right: str
+    email_address: str | None = None
+
+@functools.lru_cache(maxsize=4096)
+def _serialize(record: WorkspaceUserAdd) -> bytes:
+    """Serializes a WorkspaceUserAdd record to the JSON request body, caching repeated records."""
+    payload = {
+        "identifier": record.identifier,
+        "principalType": record.principal_type,
+        "groupUserAccessRight": record.access_right,
+    }
+    if record.email_address:
+        payload["emailAddress"] = record.email_address
+    return orjson.dumps(payload)
+
+def _workspace_user_body(
+    identifier: str,
+    principal_type: str,
+    access_right: str,
+    email_address: str | None = None
+) -> bytes:
+    """Builds the serialized request body for the Add Group User API."""
+    # Email is required for user type according to docs, include it in payload
+    if principal_type == 'User' and not email_address:
+        # The API expects identifier to be email/UPN for User, but let's keep email separate for clarity
+        # If email isn't provided, we assume identifier is the email/UPN.
+        logger.warning("Adding User principal (%s) without explicit emailAddress. Assuming identifier is email/UPN.", identifier)
+        email_address = identifier
+    elif principal_type != 'User':
+        email_address = None
+    return _serialize(WorkspaceUserAdd(identifier, principal_type, access_right, email_address))
+
 class WorkspaceAdmin:
     """Provides methods for administering Power BI Workspaces (also known as Groups)."""
 
@@ -31,11 +75,25 @@ class WorkspaceAdmin:
         if skip:
             params["$skip"] = skip
 
-        response = self.client.get("groups", params=params)
-        workspaces = response.get("value", [])
-        logger.info(f"Found {len(workspaces)} workspaces matching criteria.")
+        workspaces = list(self.client.get_all("groups", params=params))
+        logger.info("Found %s workspaces matching criteria.", len(workspaces))
         return workspaces
 
+    def iter_workspaces(self, filter_str: str | None = None) -> Iterator[dict]:
+        """Streams the workspaces the user has access to without loading the full list into memory.
+
+        Ref: https://learn.microsoft.com/en-us/rest/api/power-bi/groups/get-groups
+
+        Args:
+            filter_str: OData filter string (e.g., "startswith(name, 'Test')").
+
+        Yields:
+            dict: Each workspace (group) object.
+        """
+        logger.info("Streaming workspaces...")
+        params = {"$filter": filter_str} if filter_str else None
+        yield from self.client.iter_values("groups", params=params)
+
     def get_workspace_users(self, workspace_id: str) -> list[dict]:
         """Retrieves a list of users and their access rights for a specific workspace.
 
@@ -47,16 +105,16 @@ class WorkspaceAdmin:
         Returns:
             list[dict]: A list of user access objects for the workspace.
         """
-        logger.info(f"Fetching users for workspace ID: {workspace_id}")
+        logger.info("Fetching users for workspace ID: %s", workspace_id)
         endpoint = f"groups/{workspace_id}/users"
         try:
             response = self.client.get(endpoint)
             users = response.get("value", [])
-            logger.info(f"Found {len(users)} users for workspace {workspace_id}.")
+            logger.info("Found %s users for workspace %s.", len(users), workspace_id)
             return users
-        except Exception as e:
-            logger.error(f"Could not get users for workspace {workspace_id}: {e}")
-            self._log_api_error(e)
+        except requests.exceptions.RequestException as e:
+            logger.error("Could not get users for workspace %s: %s", workspace_id, e)
+            self.client.log_api_error(e)
             return []
 
     def add_workspace_user(
@@ -84,31 +142,18 @@ class WorkspaceAdmin:
         Returns:
             bool: True if the user was added successfully, False otherwise.
         """
-        logger.info(f"Adding {principal_type} ({identifier}) to workspace {workspace_id} with rights: {access_right}")
+        logger.info("Adding %s (%s) to workspace %s with rights: %s", principal_type, identifier, workspace_id, access_right)
         endpoint = f"groups/{workspace_id}/users"
 
-        payload = {
-            "identifier": identifier,
-            "principalType": principal_type,
-            "groupUserAccessRight": access_right,
-        }
-        # Email is required for user type according to docs, include it in payload
-        if principal_type == 'User':
-            if email_address:
-                 payload["emailAddress"] = email_address
-            else:
-                # The API expects identifier to be email/UPN for User, but let's keep email separate for clarity
-                # If email isn't provided, we assume identifier is the email/UPN.
-                logger.warning(f"Adding User principal ({identifier}) without explicit emailAddress. Assuming identifier is email/UPN.")
-                payload["emailAddress"] = identifier
+        body = _workspace_user_body(identifier, principal_type, access_right, email_address)
 
         try:
-            self.client.post(endpoint, json=payload)
-            logger.info(f"Successfully added {principal_type} {identifier} to workspace {workspace_id}.")
+            self.client.post(endpoint, data=body)
+            logger.info("Successfully added %s %s to workspace %s.", principal_type, identifier, workspace_id)
             return True
-        except Exception as e:
-            logger.error(f"Failed to add {principal_type} {identifier} to workspace {workspace_id}: {e}")
-            self._log_api_error(e)
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to add %s %s to workspace %s: %s", principal_type, identifier, workspace_id, e)
+            self.client.log_api_error(e)
             return False
 
     def delete_workspace_user(self, workspace_id: str, identifier: str, principal_type: str | None = None) -> bool:
@@ -131,29 +176,19 @@ class WorkspaceAdmin:
             bool: True if the user was deleted successfully, False otherwise.
         """
         principal_info = f"{principal_type} ({identifier})" if principal_type else identifier
-        logger.info(f"Deleting {principal_info} from workspace {workspace_id}")
+        logger.info("Deleting %s from workspace %s", principal_info, workspace_id)
 
         # The API endpoint structure requires the user identifier directly in the URL.
-        # Ensure the identifier is properly URL-encoded if it contains special characters,
-        # although the requests library usually handles this.
-        endpoint = f"groups/{workspace_id}/users/{identifier}"
+        # Percent-encode it, since requests leaves '#', '?' and '+' (e.g. guest '#EXT#' UPNs) untouched.
+        endpoint = f"groups/{workspace_id}/users/{quote(identifier, safe='')}"
 
         try:
             # Need to add a delete method to the base client
             # For now, let's assume it exists or call _request directly
             self.client._request("DELETE", endpoint)
-            logger.info(f"Successfully deleted {principal_info} from workspace {workspace_id}.")
+            logger.info("Successfully deleted %s from workspace %s.", principal_info, workspace_id)
             return True
-        except Exception as e:
-            logger.error(f"Failed to delete {principal_info} from workspace {workspace_id}: {e}")
-            self._log_api_error(e)
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to delete %s from workspace %s: %s", principal_info, workspace_id, e)
+            self.client.log_api_error(e)
             return False
-
-    def _log_api_error(self, error: Exception):
-        """Helper method to log API error details."""
-        if hasattr(error, 'response') and error.response is not None:
-            logger.error(f"API Response Status: {error.response.status_code}")
-            try:
-                logger.error(f"API Response Body: {error.response.json()}")
-            except Exception:
-                logger.error(f"API Response Body: {error.response.text}") 
\ No newline at end of file
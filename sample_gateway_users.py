@@ -1,13 +1,16 @@
 import os
+import sys
+import asyncio
 import logging
+from operator import itemgetter
 from admin.auth import PowerBIAuth
-from admin.client import PowerBIClient
-from admin.gateway import GatewayAdmin
-from azure.identity import CredentialUnavailableError
+from admin.async_client import AsyncPowerBIClient
+from admin.async_admin import AsyncGatewayAdmin
+from azure.core.exceptions import ClientAuthenticationError
 
 # --- Configuration ---
-# DefaultAzureCredential will attempt to authenticate using environment variables,
-# managed identity, Azure CLI login, etc.
+# PowerBIAuth will attempt to authenticate using environment variables,
+# managed identity and Azure CLI login, in that order.
 # You can optionally specify a tenant ID if needed.
 TENANT_ID = os.getenv("POWERBI_TENANT_ID", None) # Optional: Set if needed
 
@@ -22,70 +25,88 @@ logger = logging.getLogger(__name__)
 logging.getLogger("azure.identity").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+# User fields printed per datasource; adjust based on actual API response structure if needed
+# principalType: e.g., User, Group, ServicePrincipal
+# datasourceUserAccessRight: e.g., Read, ReadOverrideEffectiveIdentity
+_USER_FIELDS = ('displayName', 'emailAddress', 'principalType', 'datasourceUserAccessRight')
+_USER_DEFAULTS = dict.fromkeys(_USER_FIELDS, 'N/A')
+_user_fields = itemgetter(*_USER_FIELDS)
 
-def main():
-    """Main function to demonstrate gateway administration using DefaultAzureCredential."""
+
+async def main():
+    """Main function to demonstrate gateway administration using Azure Identity credentials."""
 
     try:
-        # 1. Authenticate using DefaultAzureCredential
-        logger.info("Authenticating using DefaultAzureCredential...")
+        # 1. Authenticate using the Azure Identity credential chain
+        logger.info("Authenticating using Azure Identity credentials...")
         # Pass tenant_id if specified, otherwise None
         auth = PowerBIAuth(tenant_id=TENANT_ID)
 
-        # 2. Create Client
-        client = PowerBIClient(auth)
-
-        # 3. Initialize Gateway Admin module
-        gw_admin = GatewayAdmin(client)
-
-        # 4. Get Gateways
-        gateways = gw_admin.get_gateways()
-
-        if not gateways:
-            logger.info("No gateways found or accessible for the authenticated user.")
-            return
-
-        print("\n--- Gateway Datasources and Users ---")
-
-        # 5. Iterate through Gateways and Datasources
-        for gw in gateways:
-            gateway_id = gw['id']
-            gateway_name = gw['name']
-            print(f"\nGateway: {gateway_name} (ID: {gateway_id})")
-
-            datasources = gw_admin.get_gateway_datasources(gateway_id)
-
-            if not datasources:
-                print("  No datasources found for this gateway.")
-                continue
-
-            for ds in datasources:
-                datasource_id = ds['id']
-                datasource_name = ds['datasourceName']
-                datasource_type = ds['datasourceType']
-                print(f"  Datasource: {datasource_name} (ID: {datasource_id}, Type: {datasource_type})")
-
-                # 6. Get Users for each Datasource
-                users = gw_admin.get_gateway_datasource_users(gateway_id, datasource_id)
-
-                if not users:
-                    print("    No users found for this datasource.")
-                else:
-                    print("    Users:")
-                    for user in users:
-                        # Adjust fields based on actual API response structure if needed
-                        display_name = user.get('displayName', 'N/A')
-                        email = user.get('emailAddress', 'N/A')
-                        principal_type = user.get('principalType', 'N/A') # e.g., User, Group, ServicePrincipal
-                        access_right = user.get('datasourceUserAccessRight', 'N/A') # e.g., Read, ReadOverrideEffectiveIdentity
-                        print(f"      - Name: {display_name}, Email: {email}, Type: {principal_type}, Access: {access_right}")
-
-    except CredentialUnavailableError:
-        # Specific handling for credential errors from DefaultAzureCredential
-        logger.error("Authentication failed. DefaultAzureCredential could not find valid credentials.")
-        logger.error("Please ensure you are logged in via 'az login', or have appropriate environment variables set (e.g., AZURE_CLIENT_ID, AZURE_TENANT_ID, AZURE_CLIENT_SECRET or AZURE_USERNAME, AZURE_PASSWORD), or are running in an Azure environment with Managed Identity configured.")
+        # 2. Create Client (requests are bounded by a semaphore to respect Power BI throttling)
+        async with AsyncPowerBIClient(auth, concurrency=32) as client:
+            # 3. Initialize Gateway Admin module
+            gw_admin = AsyncGatewayAdmin(client)
+
+            # 4. Get Gateways
+            gateways = await gw_admin.get_gateways()
+
+            if not gateways:
+                logger.info("No gateways found or accessible for the authenticated user.")
+                return
+
+            # 5. Fetch datasources for all gateways concurrently
+            datasource_lists = await asyncio.gather(
+                *[gw_admin.get_gateway_datasources(gw['id']) for gw in gateways]
+            )
+
+            # 6. Fetch users for all datasources concurrently
+            pairs = [
+                (gw['id'], ds)
+                for gw, datasources in zip(gateways, datasource_lists)
+                for ds in datasources
+            ]
+            user_lists = await asyncio.gather(
+                *[gw_admin.get_gateway_datasource_users(gateway_id, ds['id']) for gateway_id, ds in pairs]
+            )
+            users_by_datasource = {
+                (gateway_id, ds['id']): users for (gateway_id, ds), users in zip(pairs, user_lists)
+            }
+
+            print("\n--- Gateway Datasources and Users ---")
+
+            # 7. Print results grouped by Gateway and Datasource
+            for gw, datasources in zip(gateways, datasource_lists):
+                gateway_id = gw['id']
+                gateway_name = gw['name']
+                print(f"\nGateway: {gateway_name} (ID: {gateway_id})")
+
+                if not datasources:
+                    print("  No datasources found for this gateway.")
+                    continue
+
+                for ds in datasources:
+                    datasource_id = ds['id']
+                    datasource_name = ds['datasourceName']
+                    datasource_type = ds['datasourceType']
+                    print(f"  Datasource: {datasource_name} (ID: {datasource_id}, Type: {datasource_type})")
+
+                    users = users_by_datasource[(gateway_id, datasource_id)]
+
+                    if not users:
+                        print("    No users found for this datasource.")
+                    else:
+                        rows = ["    Users:"]
+                        for user in users:
+                            display_name, email, principal_type, access_right = _user_fields({**_USER_DEFAULTS, **user})
+                            rows.append(f"      - Name: {display_name}, Email: {email}, Type: {principal_type}, Access: {access_right}")
+                        sys.stdout.write("\n".join(rows) + "\n")
+
+    except ClientAuthenticationError:
+        # Specific handling for credential errors from the credential chain
+        logger.error("Authentication failed. No credential in the chain could find valid credentials.")
+        logger.error("Please ensure you are logged in via 'az login', or have appropriate environment variables set (e.g., AZURE_CLIENT_ID, AZURE_TENANT_ID, AZURE_CLIENT_SECRET), or are running in an Azure environment with Managed Identity configured.")
     except Exception as e:
         logger.error(f"An error occurred: {e}", exc_info=True)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file